@@ -2,23 +2,53 @@
 from __future__ import annotations
 
 import json
+import mmap
+import sys
+from collections import ChainMap, OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Iterator, Mapping, Optional
 
 from .errors import BackendError, ErrorCode
 from .models import GlobalSettings, ProfileSettings, ResourceLimits, RuntimeConfig
 
+try:  # pragma: no cover - optional accelerator, stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_CONFIG_PATH = Path("config/defaults.json")
 ALLOWED_ERROR_POLICIES = {"fail-fast", "strict", "replace"}
-
-
-@dataclass(slots=True)
+_ALLOWED_JOINED = ", ".join(sorted(ALLOWED_ERROR_POLICIES))
+# Lowercased policy -> canonical policy name / Python codec error handler.
+_CANONICAL_POLICIES = {"fail-fast": "fail-fast", "strict": "fail-fast", "replace": "replace"}
+_POLICY_TO_MODE = {"fail-fast": "strict", "strict": "strict", "replace": "replace"}
+# Config documents at or above this size are memory-mapped instead of copied into a bytes buffer.
+MMAP_THRESHOLD_BYTES = 1_048_576
+# Parsed documents are reused while the file's (mtime, size) stay unchanged.
+DOCUMENT_CACHE_SIZE = 16
+
+# Positive integer fields validated for every profile / resource_limits block, in schema order.
+_PROFILE_INT_FIELDS = (
+    "block_size",
+    "min_gap_lines",
+    "max_parallel_files",
+    "sample_values_cap",
+    "writer_chunk_rows",
+)
+_RESOURCE_LIMIT_INT_FIELDS = ("memory_mb", "spill_mb", "max_workers")
+_REQUIRED_PROFILE_FIELDS = ("description",) + _PROFILE_INT_FIELDS
+_REQUIRED_PROFILE_FIELD_SET = frozenset(_REQUIRED_PROFILE_FIELDS)
+_GLOBAL_DEFAULTS = GlobalSettings()
+_RESOURCE_DEFAULTS = ResourceLimits()
+
+
+@dataclass(frozen=True, slots=True)
 class ConfigDocument:
     source: Path
     version: int
     global_settings: GlobalSettings
-    profiles: Dict[str, ProfileSettings]
+    profiles: Mapping[str, ProfileSettings]
 
 
 def load_runtime_config(
@@ -50,12 +80,69 @@ def load_config_document(
     config_path: Optional[Path] = None,
     overrides: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> ConfigDocument:
+    """Load and validate the config file.
+
+    When ``profile_name`` is given only that profile is validated and returned.
+    Documents are cached per file state, so repeated loads skip parsing entirely.
+    """
+
     cfg_path = config_path or DEFAULT_CONFIG_PATH
+    cache_key = _document_cache_key(cfg_path, profile_name, overrides)
+    if cache_key is not None:
+        cached = _DOCUMENT_CACHE.get(cache_key)
+        if cached is not None:
+            _DOCUMENT_CACHE.move_to_end(cache_key)
+            return cached
+
+    document = _parse_config_document(cfg_path, profile_name, overrides)
+    if cache_key is not None:
+        _DOCUMENT_CACHE[cache_key] = document
+        while len(_DOCUMENT_CACHE) > DOCUMENT_CACHE_SIZE:
+            _DOCUMENT_CACHE.popitem(last=False)
+    return document
+
+
+def clear_config_cache() -> None:
+    """Drop every cached ConfigDocument."""
+
+    _DOCUMENT_CACHE.clear()
+
+
+def error_mode_from_policy(policy: str) -> str:
+    """Translate human-friendly error policy into Python's encoding error handler."""
+
+    return _POLICY_TO_MODE.get(policy.lower(), "replace")
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+
+_DOCUMENT_CACHE: OrderedDict[tuple[Any, ...], ConfigDocument] = OrderedDict()
+
+
+def _document_cache_key(
+    path: Path,
+    profile_name: Optional[str],
+    overrides: Optional[Dict[str, Dict[str, Any]]],
+) -> Optional[tuple[Any, ...]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None  # let the loader report the missing file
+    overrides_key = json.dumps(overrides or {}, sort_keys=True, default=str)
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size, profile_name, overrides_key)
+
+
+def _parse_config_document(
+    cfg_path: Path,
+    profile_name: Optional[str],
+    overrides: Optional[Dict[str, Dict[str, Any]]],
+) -> ConfigDocument:
     raw = _read_config_json(cfg_path)
 
     version = _require_positive_int(raw.get("version"), "version", cfg_path)
     global_section = raw.get("global")
-    if not isinstance(global_section, Mapping):
+    if not isinstance(global_section, dict):
         raise BackendError(ErrorCode.CONFIG_ERROR, f"'global' section missing in {cfg_path}")
 
     overrides = overrides or {}
@@ -63,75 +150,130 @@ def load_config_document(
     global_settings = _build_global_settings(global_data, cfg_path)
 
     profiles_section = raw.get("profiles")
-    if not isinstance(profiles_section, Mapping) or not profiles_section:
+    if not isinstance(profiles_section, dict) or not profiles_section:
         raise BackendError(ErrorCode.CONFIG_ERROR, f"'profiles' section missing in {cfg_path}")
 
-    profile_overrides = overrides.get("profile") or {}
     profiles: Dict[str, ProfileSettings] = {}
-    for name, profile_data in profiles_section.items():
-        if not isinstance(profile_data, Mapping):
+    if profile_name:
+        if profile_name not in profiles_section:
             raise BackendError(
                 ErrorCode.CONFIG_ERROR,
-                f"Profile '{name}' must be an object in {cfg_path}",
+                f"Profile '{profile_name}' not found in {cfg_path}",
             )
-        merged = dict(profile_data)
-        if profile_name and name == profile_name and profile_overrides:
-            merged = {**merged, **profile_overrides}
-        profiles[name] = _build_profile_settings(name, merged, cfg_path)
-
-    if profile_name and profile_name not in profiles:
-        raise BackendError(
-            ErrorCode.CONFIG_ERROR,
-            f"Profile '{profile_name}' not found in {cfg_path}",
+        # Only the requested subtree is validated now; siblings are built on first access.
+        profiles[profile_name] = _build_profile_entry(
+            profile_name,
+            profiles_section[profile_name],
+            cfg_path,
+            overrides.get("profile") or {},
         )
+    else:
+        for name, profile_data in profiles_section.items():
+            profiles[name] = _build_profile_entry(name, profile_data, cfg_path, {})
 
     return ConfigDocument(
         source=cfg_path,
         version=version,
         global_settings=global_settings,
-        profiles=profiles,
+        profiles=_LazyProfiles(profiles_section, profiles, cfg_path),
     )
 
 
-def error_mode_from_policy(policy: str) -> str:
-    """Translate human-friendly error policy into Python's encoding error handler."""
-
-    return "strict" if policy.lower() in {"fail-fast", "strict"} else "replace"
-
-
-# ---------------------------------------------------------------------------
-# Internal helpers
+class _LazyProfiles(Mapping[str, ProfileSettings]):
+    """Read-only profile view that validates raw profile sections on first access.
+
+    Built profiles are memoized in ``_built``, so the first lookup of a profile writes
+    into a ConfigDocument that is otherwise frozen and may be shared through the
+    document cache. The write is idempotent: the raw sections never change and every
+    build of a name yields an equal ProfileSettings, so sharing stays safe. Membership
+    checks only consult the raw sections and never build or validate a profile.
+    """
+
+    __slots__ = ("_raw", "_built", "_source")
+
+    def __init__(
+        self,
+        raw: Mapping[str, Any],
+        built: Dict[str, ProfileSettings],
+        source: Path,
+    ) -> None:
+        self._raw = raw
+        self._built = built
+        self._source = source
+
+    def __getitem__(self, name: str) -> ProfileSettings:
+        settings = self._built.get(name)
+        if settings is None:
+            settings = _build_profile_entry(name, self._raw[name], self._source, {})
+            self._built[name] = settings
+        return settings
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
+def _build_profile_entry(
+    name: str,
+    profile_data: Any,
+    source: Path,
+    profile_overrides: Dict[str, Any],
+) -> ProfileSettings:
+    if not isinstance(profile_data, dict):
+        raise BackendError(
+            ErrorCode.CONFIG_ERROR,
+            f"Profile '{name}' must be an object in {source}",
+        )
+    merged: Mapping[str, Any] = (
+        ChainMap(profile_overrides, profile_data) if profile_overrides else profile_data
+    )
+    return _build_profile_settings(name, merged, source)
 
 
 def _read_config_json(path: Path) -> Dict[str, Any]:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return _load_json_file(path)
     except FileNotFoundError as exc:  # pragma: no cover - depends on filesystem
         raise BackendError(ErrorCode.CONFIG_ERROR, f"Config file '{path}' not found") from exc
-    except json.JSONDecodeError as exc:
+    except json.JSONDecodeError as exc:  # orjson.JSONDecodeError subclasses this
         raise BackendError(ErrorCode.CONFIG_ERROR, f"Config file '{path}' is not valid JSON: {exc}") from exc
 
 
+def _load_json_file(path: Path) -> Dict[str, Any]:
+    if orjson is not None and path.stat().st_size >= MMAP_THRESHOLD_BYTES:
+        # orjson parses straight from the mapped pages; stdlib json cannot take a buffer.
+        with path.open("rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
 def _build_global_settings(data: Mapping[str, Any], source: Path) -> GlobalSettings:
-    encoding = _require_string(data.get("encoding", GlobalSettings().encoding), "global.encoding", source)
+    encoding = _require_string(data.get("encoding", _GLOBAL_DEFAULTS.encoding), "global.encoding", source)
     error_policy = _normalize_error_policy(
-        data.get("error_policy", GlobalSettings().error_policy),
+        data.get("error_policy", _GLOBAL_DEFAULTS.error_policy),
         source,
     )
     synonym_dictionary = _require_path(
-        data.get("synonym_dictionary", GlobalSettings().synonym_dictionary),
+        data.get("synonym_dictionary", _GLOBAL_DEFAULTS.synonym_dictionary),
         "global.synonym_dictionary",
         source,
     )
     canonical_schema_path = _require_path(
-        data.get("canonical_schema_path", GlobalSettings().canonical_schema_path),
+        data.get("canonical_schema_path", _GLOBAL_DEFAULTS.canonical_schema_path),
         "global.canonical_schema_path",
         source,
     )
     return GlobalSettings(
-        encoding=encoding,
-        error_policy=error_policy,
+        encoding=sys.intern(encoding),
+        error_policy=sys.intern(error_policy),
         synonym_dictionary=synonym_dictionary,
         canonical_schema_path=canonical_schema_path,
     )
@@ -139,85 +281,61 @@ def _build_global_settings(data: Mapping[str, Any], source: Path) -> GlobalSetti
 
 def _build_profile_settings(name: str, data: Mapping[str, Any], source: Path) -> ProfileSettings:
     prefix = f"profiles.{name}"
-    required_fields = (
-        "description",
-        "block_size",
-        "min_gap_lines",
-        "max_parallel_files",
-        "sample_values_cap",
-        "writer_chunk_rows",
-    )
-    missing = [field for field in required_fields if field not in data]
-    if missing:
+    if not _REQUIRED_PROFILE_FIELD_SET.issubset(data.keys()):
+        missing = [field for field in _REQUIRED_PROFILE_FIELDS if field not in data]
         raise BackendError(
             ErrorCode.CONFIG_ERROR,
             f"Profile '{name}' missing fields {missing} in {source}",
         )
 
     description = _require_string(data.get("description"), f"{prefix}.description", source)
-    block_size = _require_positive_int(data.get("block_size"), f"{prefix}.block_size", source)
-    min_gap_lines = _require_positive_int(data.get("min_gap_lines"), f"{prefix}.min_gap_lines", source)
-    max_parallel_files = _require_positive_int(
-        data.get("max_parallel_files"), f"{prefix}.max_parallel_files", source
-    )
-    sample_values_cap = _require_positive_int(
-        data.get("sample_values_cap"), f"{prefix}.sample_values_cap", source
-    )
-    writer_chunk_rows = _require_positive_int(
-        data.get("writer_chunk_rows"), f"{prefix}.writer_chunk_rows", source
-    )
+    numbers: Dict[str, int] = {}
+    for field_name in _PROFILE_INT_FIELDS:
+        value = data.get(field_name)
+        if type(value) is not int or value <= 0:
+            value = _require_positive_int(value, f"{prefix}.{field_name}", source)
+        numbers[field_name] = value
 
     limits_data = data.get("resource_limits", {}) or {}
-    if not isinstance(limits_data, Mapping):
+    if not isinstance(limits_data, dict):
         raise BackendError(
             ErrorCode.CONFIG_ERROR,
             f"{prefix}.resource_limits must be an object in {source}",
         )
+    limits: Dict[str, Optional[int]] = {}
+    for field_name in _RESOURCE_LIMIT_INT_FIELDS:
+        limit = limits_data.get(field_name)
+        if limit is not None and (type(limit) is not int or limit <= 0):
+            limit = _optional_positive_int(limit, f"{prefix}.resource_limits.{field_name}", source)
+        limits[field_name] = limit
     resource_limits = ResourceLimits(
-        memory_mb=_optional_positive_int(
-            limits_data.get("memory_mb"), f"{prefix}.resource_limits.memory_mb", source
-        ),
-        spill_mb=_optional_positive_int(
-            limits_data.get("spill_mb"), f"{prefix}.resource_limits.spill_mb", source
-        ),
-        max_workers=_optional_positive_int(
-            limits_data.get("max_workers"), f"{prefix}.resource_limits.max_workers", source
-        ),
+        **limits,
         temp_dir=_require_path(
-            limits_data.get("temp_dir", ResourceLimits().temp_dir),
+            limits_data.get("temp_dir", _RESOURCE_DEFAULTS.temp_dir),
             f"{prefix}.resource_limits.temp_dir",
             source,
         ),
     )
 
-    return ProfileSettings(
-        description=description,
-        block_size=block_size,
-        min_gap_lines=min_gap_lines,
-        max_parallel_files=max_parallel_files,
-        sample_values_cap=sample_values_cap,
-        writer_chunk_rows=writer_chunk_rows,
-        resource_limits=resource_limits,
-    )
+    return ProfileSettings(description=description, resource_limits=resource_limits, **numbers)
 
 
 def _normalize_error_policy(value: Any, source: Path) -> str:
-    policy = _require_string(value, "global.error_policy", source).lower()
-    if policy not in {p.lower() for p in ALLOWED_ERROR_POLICIES}:
-        allowed = ", ".join(sorted(ALLOWED_ERROR_POLICIES))
+    policy = _CANONICAL_POLICIES.get(_require_string(value, "global.error_policy", source).lower())
+    if policy is None:
         raise BackendError(
             ErrorCode.CONFIG_ERROR,
-            f"Unsupported error_policy '{value}' in {source}. Allowed: {allowed}",
+            f"Unsupported error_policy '{value}' in {source}. Allowed: {_ALLOWED_JOINED}",
         )
-    return "fail-fast" if policy in {"fail-fast", "strict"} else "replace"
+    return policy
 
 
 def _require_string(value: Any, field: str, source: Path) -> str:
     if not isinstance(value, str):
-        raise BackendError(ErrorCode.CONFIG_ERROR, f"{field} must be a string in {source}")
+        raise BackendError(ErrorCode.CONFIG_ERROR, "%s must be a string in %s", field, source)
     text = value.strip()
     if not text:
-        raise BackendError(ErrorCode.CONFIG_ERROR, f"{field} must be non-empty in {source}")
+        raise BackendError(ErrorCode.CONFIG_ERROR, "%s must be non-empty in %s", field, source)
     return text
 
 
@@ -232,12 +350,16 @@ def _require_positive_int(value: Any, field: str, source: Path) -> int:
     except (TypeError, ValueError) as exc:
         raise BackendError(
             ErrorCode.CONFIG_ERROR,
-            f"{field} must be an integer in {source}",
+            "%s must be an integer in %s",
+            field,
+            source,
         ) from exc
     if num <= 0:
         raise BackendError(
             ErrorCode.CONFIG_ERROR,
-            f"{field} must be greater than zero in {source}",
+            "%s must be greater than zero in %s",
+            field,
+            source,
         )
     return num
 
@@ -250,11 +372,15 @@ def _optional_positive_int(value: Any, field: str, source: Path) -> Optional[int
     except (TypeError, ValueError) as exc:
         raise BackendError(
             ErrorCode.CONFIG_ERROR,
-            f"{field} must be an integer in {source}",
+            "%s must be an integer in %s",
+            field,
+            source,
         ) from exc
     if num <= 0:
         raise BackendError(
             ErrorCode.CONFIG_ERROR,
-            f"{field} must be greater than zero in {source}",
+            "%s must be greater than zero in %s",
+            field,
+            source,
         )
     return num
@@ -1,25 +1,43 @@
 """Shared error codes and exceptions for backend agents."""
 from __future__ import annotations
 
-from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Final, Optional
 
 
-class ErrorCode(str, Enum):
-    CONFIG_ERROR = "CONFIG_ERROR"
-    SCHEMA_ERROR = "SCHEMA_ERROR"
-    IO_ERROR = "IO_ERROR"
-    STATE_ERROR = "STATE_ERROR"
+class ErrorCode:
+    """Namespace of error codes; members are plain strings, so comparisons stay cheap."""
+
+    CONFIG_ERROR: Final = "CONFIG_ERROR"
+    SCHEMA_ERROR: Final = "SCHEMA_ERROR"
+    IO_ERROR: Final = "IO_ERROR"
+    STATE_ERROR: Final = "STATE_ERROR"
 
 
 class BackendError(RuntimeError):
-    """Exception carrying a structured error code for CLI/agents."""
+    """Exception carrying a structured error code for CLI/agents.
+
+    ``message`` may be a ``%``-style template; extra positional arguments are
+    interpolated only when the error is rendered, so handlers that inspect
+    ``code`` alone never pay for formatting.
+    """
 
-    def __init__(self, code: ErrorCode, message: str, *, context: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        *message_args: Any,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
         super().__init__(message)
         self.code = code
         self.context = context or {}
+        self._message_args = message_args
+
+    @property
+    def message(self) -> str:
+        template = super().__str__()
+        return template % self._message_args if self._message_args else template
 
     def __str__(self) -> str:  # pragma: no cover - formatting sugar
-        base = super().__str__()
-        return f"[{self.code}] {base}" if base else self.code.value
+        base = self.message
+        return f"[{self.code}] {base}" if base else self.code
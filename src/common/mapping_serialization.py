@@ -1,8 +1,11 @@
 """Shared MappingConfig serialization helpers."""
 from __future__ import annotations
 
+import json
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Union
 from uuid import UUID
 
 from .models import (
@@ -27,6 +30,31 @@ from .versioning import (
     LEGACY_MAPPING_ARTIFACT_VERSION,
 )
 
+try:  # pragma: no cover - optional accelerator, stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+_intern = sys.intern
+
+
+@lru_cache(maxsize=1024)
+def _as_path(value: str) -> Path:
+    """Return a shared Path for *value*; blocks and variants repeat a handful of file paths."""
+
+    return Path(value)
+
+
+def _str_list(values: object) -> List[str]:
+    """Copy a decoded string array, calling str() only when a non-str item is present."""
+
+    if not values:
+        return []
+    if all(type(item) is str for item in values):
+        return list(values)
+    return [str(item) for item in values]
+
 
 def mapping_to_dict(mapping: MappingConfig, *, include_samples: bool = False) -> Dict[str, object]:
     payload: Dict[str, object] = {
@@ -49,6 +77,27 @@ def mapping_to_dict(mapping: MappingConfig, *, include_samples: bool = False) ->
     return payload
 
 
+def mapping_to_json_bytes(
+    mapping: MappingConfig,
+    *,
+    include_samples: bool = False,
+    indent: bool = False,
+) -> bytes:
+    """Encode a mapping artifact directly to UTF-8 JSON bytes (orjson when installed)."""
+
+    payload = mapping_to_dict(mapping, include_samples=include_samples)
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(payload, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def mapping_from_json_bytes(data: bytes) -> MappingConfig:
+    """Decode a mapping artifact from JSON bytes produced by :func:`mapping_to_json_bytes`."""
+
+    payload = orjson.loads(data) if orjson is not None else json.loads(data)
+    return mapping_from_dict(payload)
+
+
 def mapping_from_dict(data: Dict[str, object]) -> MappingConfig:
     source_version = str(data.get("artifact_version", LEGACY_MAPPING_ARTIFACT_VERSION))
     artifact_version = (
@@ -105,18 +154,22 @@ def serialize_column_profile_result(item: ColumnProfileResult) -> Dict[str, obje
 
 
 def deserialize_column_profile_result(data: Dict[str, object]) -> ColumnProfileResult:
+    numeric_min = data.get("numeric_min")
+    numeric_max = data.get("numeric_max")
+    date_min = data.get("date_min")
+    date_max = data.get("date_max")
     return ColumnProfileResult(
-        file_id=str(data.get("file_id", "")),
+        file_id=_intern(str(data.get("file_id", ""))),
         column_index=int(data.get("column_index", 0)),
-        header=str(data.get("header", "")),
+        header=_intern(str(data.get("header", ""))),
         type_distribution={str(k): int(v) for k, v in data.get("type_distribution", {}).items()},
         unique_estimate=int(data.get("unique_estimate", 0)),
         null_count=int(data.get("null_count", 0)),
         total_values=int(data.get("total_values", 0)),
-        numeric_min=float(data["numeric_min"]) if "numeric_min" in data else None,
-        numeric_max=float(data["numeric_max"]) if "numeric_max" in data else None,
-        date_min=str(data["date_min"]) if "date_min" in data else None,
-        date_max=str(data["date_max"]) if "date_max" in data else None,
+        numeric_min=float(numeric_min) if numeric_min is not None else None,
+        numeric_max=float(numeric_max) if numeric_max is not None else None,
+        date_min=str(date_min) if date_min is not None else None,
+        date_max=str(date_max) if date_max is not None else None,
     )
 
 
@@ -129,23 +182,29 @@ def serialize_file_header(summary: FileHeaderSummary) -> Dict[str, object]:
 
 def deserialize_file_header(data: Dict[str, object]) -> FileHeaderSummary:
     return FileHeaderSummary(
-        file_id=str(data.get("file_id", "")),
-        headers=[str(item) for item in data.get("headers", [])],
+        file_id=_intern(str(data.get("file_id", ""))),
+        headers=_str_list(data.get("headers")),
     )
 
 
-def serialize_header_occurrence(item: HeaderOccurrence) -> Dict[str, object]:
-    return {
-        "raw_header": item.raw_header,
-        "file_id": item.file_id,
-        "column_index": item.column_index,
-    }
+def serialize_header_occurrence(item: HeaderOccurrence) -> List[object]:
+    """Encode an occurrence as a positional ``[raw_header, file_id, column_index]`` row."""
+
+    return [item.raw_header, item.file_id, item.column_index]
 
 
-def deserialize_header_occurrence(data: Dict[str, object]) -> HeaderOccurrence:
+def deserialize_header_occurrence(data: Union[List[object], Dict[str, object]]) -> HeaderOccurrence:
+    if isinstance(data, list):
+        raw_header, file_id, column_index = data
+        return HeaderOccurrence(
+            raw_header=_intern(str(raw_header)),
+            file_id=_intern(str(file_id)),
+            column_index=int(column_index),
+        )
+    # Artifacts written before 2.1.0 store occurrences as keyed objects.
     return HeaderOccurrence(
-        raw_header=str(data.get("raw_header", "")),
-        file_id=str(data.get("file_id", "")),
+        raw_header=_intern(str(data.get("raw_header", ""))),
+        file_id=_intern(str(data.get("file_id", ""))),
         column_index=int(data.get("column_index", 0)),
     )
 
@@ -160,7 +219,7 @@ def serialize_header_profile(item: HeaderTypeProfile) -> Dict[str, object]:
 def deserialize_header_profile(data: Dict[str, object]) -> HeaderTypeProfile:
     profile_data = {str(k): int(v) for k, v in data.get("type_profile", {}).items()}
     return HeaderTypeProfile(
-        raw_header=str(data.get("raw_header", "")),
+        raw_header=_intern(str(data.get("raw_header", ""))),
         type_profile=profile_data,
     )
 
@@ -182,10 +241,10 @@ def serialize_header_variant(variant: HeaderVariant, include_samples: bool) -> D
 def deserialize_header_variant(data: Dict[str, object]) -> HeaderVariant:
     sample_values = set(str(item) for item in data.get("sample_values", []))
     return HeaderVariant(
-        file_path=Path(str(data["file_path"])),
+        file_path=_as_path(str(data["file_path"])),
         column_index=int(data["column_index"]),
-        raw_name=str(data.get("raw_name", "")),
-        normalized_name=str(data.get("normalized_name", "")),
+        raw_name=_intern(str(data.get("raw_name", ""))),
+        normalized_name=_intern(str(data.get("normalized_name", ""))),
         detected_types={str(k): int(v) for k, v in data.get("detected_types", {}).items()},
         sample_values=sample_values,
         row_count=int(data.get("row_count", 0)),
@@ -211,8 +270,9 @@ def deserialize_header_cluster(data: Dict[str, object]) -> HeaderCluster:
         or LEGACY_HEADER_CLUSTER_VERSION
     )
     version = stored_version if stored_version == HEADER_CLUSTER_VERSION else HEADER_CLUSTER_VERSION
+    cluster_id = data.get("cluster_id")
     return HeaderCluster(
-        cluster_id=UUID(str(data.get("cluster_id", UUID(int=0)))) if data.get("cluster_id") else UUID(int=0),
+        cluster_id=UUID(str(cluster_id)) if cluster_id else UUID(int=0),
         canonical_name=str(data.get("canonical_name", "")),
         variants=[deserialize_header_variant(item) for item in variants_data],
         confidence_score=float(data.get("confidence_score", 1.0)),
@@ -238,14 +298,17 @@ def serialize_schema_mapping_entry(entry: SchemaMappingEntry) -> Dict[str, objec
 
 
 def deserialize_schema_mapping_entry(data: Dict[str, object]) -> SchemaMappingEntry:
+    offset_from_index = data.get("offset_from_index")
+    offset_reason = data.get("offset_reason")
+    offset_confidence = data.get("offset_confidence")
     return SchemaMappingEntry(
-        file_path=Path(str(data["file_path"])),
+        file_path=_as_path(str(data["file_path"])),
         source_index=int(data["source_index"]),
         canonical_name=str(data.get("canonical_name", "")),
         target_index=int(data["target_index"]),
-        offset_from_index=int(data["offset_from_index"]) if "offset_from_index" in data else None,
-        offset_reason=str(data["offset_reason"]) if "offset_reason" in data else None,
-        offset_confidence=float(data["offset_confidence"]) if "offset_confidence" in data else None,
+        offset_from_index=int(offset_from_index) if offset_from_index is not None else None,
+        offset_reason=str(offset_reason) if offset_reason is not None else None,
+        offset_confidence=float(offset_confidence) if offset_confidence is not None else None,
     )
 
 
@@ -264,7 +327,7 @@ def deserialize_block(data: Dict[str, object]) -> FileBlock:
     signature = deserialize_signature(data.get("signature", {}))
     schema_id = data.get("schema_id")
     return FileBlock(
-        file_path=Path(data["file_path"]),
+        file_path=_as_path(str(data["file_path"])),
         block_id=int(data["block_id"]),
         start_line=int(data["start_line"]),
         end_line=int(data["end_line"]),
@@ -289,7 +352,8 @@ def deserialize_signature(data: Dict[str, object]) -> SchemaSignature:
     columns_raw = data.get("columns", {})
     columns: Dict[int, ColumnStats] = {}
     for idx_str, stats in columns_raw.items():
-        columns[int(idx_str)] = deserialize_column_stats(stats, index=int(idx_str))
+        idx = int(idx_str)
+        columns[idx] = deserialize_column_stats(stats, index=idx)
     return SchemaSignature(
         delimiter=data.get("delimiter", ","),
         column_count=int(data.get("column_count", 0)),
@@ -304,7 +368,7 @@ def serialize_column_stats(stats: ColumnStats, include_samples: bool) -> Dict[st
         "maybe_numeric": stats.maybe_numeric,
         "maybe_date": stats.maybe_date,
         "maybe_bool": stats.maybe_bool,
-        "type_counts": dict(stats.type_counts),
+        "type_counts": stats.type_counts.copy(),
     }
     if include_samples:
         payload["sample_values"] = sorted(stats.sample_values)
@@ -341,13 +405,16 @@ def serialize_schema(schema: SchemaDefinition) -> Dict[str, object]:
 
 def deserialize_schema(data: Dict[str, object]) -> SchemaDefinition:
     columns_data = data.get("columns", [])
+    canonical_schema_id = data.get("canonical_schema_id")
+    canonical_namespace = data.get("canonical_namespace")
+    canonical_schema_version = data.get("canonical_schema_version")
     return SchemaDefinition(
         id=UUID(data["id"]),
         name=str(data.get("name", "")),
         columns=[deserialize_schema_column(item) for item in columns_data],
-        canonical_schema_id=str(data["canonical_schema_id"]) if data.get("canonical_schema_id") else None,
-        canonical_namespace=str(data["canonical_namespace"]) if data.get("canonical_namespace") else None,
-        canonical_schema_version=str(data["canonical_schema_version"]) if data.get("canonical_schema_version") else None,
+        canonical_schema_id=str(canonical_schema_id) if canonical_schema_id else None,
+        canonical_namespace=str(canonical_namespace) if canonical_namespace else None,
+        canonical_schema_version=str(canonical_schema_version) if canonical_schema_version else None,
     )
 
 
@@ -366,6 +433,6 @@ def deserialize_schema_column(data: Dict[str, object]) -> SchemaColumn:
         index=int(data.get("index", 0)),
         raw_name=str(data.get("raw_name", "")),
         normalized_name=str(data.get("normalized_name", "")),
-        data_type=str(data.get("data_type", "string")),
-        known_variants=[str(item) for item in data.get("known_variants", [])],
+        data_type=_intern(str(data.get("data_type", "string"))),
+        known_variants=_str_list(data.get("known_variants")),
     )
@@ -1,9 +1,10 @@
 """Data models shared across UI, core engine, and storage layers."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Set, Tuple, Union
+from typing import Dict, FrozenSet, List, Literal, Optional, Set, Tuple, Union
 from uuid import UUID, uuid4
 
 from .versioning import HEADER_CLUSTER_VERSION, MAPPING_ARTIFACT_VERSION
@@ -89,7 +90,7 @@ class CanonicalColumnSpec:
     required: bool = True
     allow_null: bool = False
     example: Optional[str] = None
-    allowed_values: Optional[Set[str]] = None
+    allowed_values: Optional[FrozenSet[str]] = None
     min_value: Optional[float] = None
     max_value: Optional[float] = None
     pattern: Optional[str] = None
@@ -115,12 +116,12 @@ class CanonicalColumnSpec:
         allowed_values = payload.get("allowed_values")
         return cls(
             name=str(payload["name"]),
-            data_type=payload.get("data_type", "string"),
+            data_type=sys.intern(str(payload.get("data_type", "string"))),
             description=str(payload.get("description", "")),
             required=bool(payload.get("required", True)),
             allow_null=bool(payload.get("allow_null", False)),
             example=payload.get("example"),
-            allowed_values=set(allowed_values) if allowed_values else None,
+            allowed_values=frozenset(allowed_values) if allowed_values else None,
             min_value=payload.get("min_value"),
             max_value=payload.get("max_value"),
             pattern=payload.get("pattern"),
@@ -183,20 +184,16 @@ class CanonicalSchema:
 class CanonicalSchemaRegistry:
     """In-memory registry of approved canonical schemas."""
 
-    schemas: Dict[str, CanonicalSchema] = field(default_factory=dict)
-
-    def _make_key(self, schema_id: str, namespace: Optional[str]) -> str:
-        ns = namespace or "default"
-        return f"{ns}::{schema_id}"
+    schemas: Dict[Tuple[str, str], CanonicalSchema] = field(default_factory=dict)
 
     def register(self, schema: CanonicalSchema) -> None:
         """Register/overwrite a schema version inside the registry."""
 
-        key = self._make_key(schema.schema_id, schema.namespace)
-        self.schemas[key] = schema
+        namespace = sys.intern(schema.namespace or "default")
+        self.schemas[(namespace, schema.schema_id)] = schema
 
     def get(self, schema_id: str, namespace: Optional[str] = None) -> Optional[CanonicalSchema]:
-        return self.schemas.get(self._make_key(schema_id, namespace))
+        return self.schemas.get((namespace or "default", schema_id))
 
 
 @dataclass(slots=True)
@@ -339,7 +336,7 @@ class FileAnalysisResult:
     column_profiles: List[ColumnProfileResult] = field(default_factory=list)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class GlobalSettings:
     """Global knobs that apply across profiles."""
 
@@ -349,7 +346,7 @@ class GlobalSettings:
     canonical_schema_path: str = "storage/canonical_schemas.json"
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ResourceLimits:
     """Optional hardware budgets enforced by the ResourceManager."""
 
@@ -359,7 +356,7 @@ class ResourceLimits:
     temp_dir: str = "artifacts/tmp"
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ProfileSettings:
     """Profile-specific resource limits."""
 
@@ -372,7 +369,7 @@ class ProfileSettings:
     resource_limits: ResourceLimits = field(default_factory=ResourceLimits)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
     """Resolved configuration for a single run."""
 
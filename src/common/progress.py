@@ -3,30 +3,80 @@ from __future__ import annotations
 
 import json
 import time
-from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import BinaryIO, Iterable, List, Optional
 
 from .models import FileProgress
 
+try:  # pragma: no cover - optional accelerator, stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _jsonl_line(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 class ProgressLogger:
-    """Writes progress events to JSONL for later inspection."""
+    """Writes progress events to JSONL for later inspection.
 
-    def __init__(self, path: Optional[Path]) -> None:
+    The log file is opened on the first event and kept open until :meth:`close`;
+    emitting after ``close`` reopens it in append mode. Events are written in
+    batches of ``flush_every`` lines (one write and flush per batch), and any
+    remainder is written on ``close``.
+    """
+
+    def __init__(self, path: Optional[Path], *, flush_every: int = 1) -> None:
         self.path = path
+        self.flush_every = max(1, flush_every)
+        self._handle: Optional[BinaryIO] = None
+        self._pending: List[bytes] = []
         if path:
             path.parent.mkdir(parents=True, exist_ok=True)
 
     def emit(self, progress: FileProgress) -> None:
         if not self.path:
             return
-        payload = asdict(progress)
-        payload["file_path"] = str(progress.file_path)
-        payload["timestamp"] = time.time()
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload))
-            handle.write("\n")
+        payload = {
+            "file_path": str(progress.file_path),
+            "processed_rows": progress.processed_rows,
+            "total_rows": progress.total_rows,
+            "current_phase": progress.current_phase,
+            "eta_seconds": progress.eta_seconds,
+            "schema_id": progress.schema_id,
+            "schema_name": progress.schema_name,
+            "rows_per_second": progress.rows_per_second,
+            "spill_rows": progress.spill_rows,
+            "timestamp": time.time(),
+        }
+        self._pending.append(_jsonl_line(payload))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending or not self.path:
+            return
+        handle = self._handle
+        if handle is None:
+            handle = self._handle = self.path.open("ab")
+        handle.write(b"".join(self._pending))
+        handle.flush()
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self) -> "ProgressLogger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 class BenchmarkRecorder:
@@ -38,6 +88,5 @@ class BenchmarkRecorder:
 
     def record(self, dataset: str, metrics: dict) -> None:
         payload = {"dataset": dataset, **metrics, "timestamp": time.time()}
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload))
-            handle.write("\n")
+        with self.path.open("ab") as handle:
+            handle.write(_jsonl_line(payload))
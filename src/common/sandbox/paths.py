@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Optional
 
@@ -26,10 +26,12 @@ class Sandbox:
 
     root: Path
     allowlist: tuple[Path, ...] = ()
+    _allowed_parts: tuple[tuple[str, ...], ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.root = self._normalize(self.root)
         self.allowlist = tuple(self._normalize(path) for path in self.allowlist)
+        self._allowed_parts = tuple(path.parts for path in (self.root, *self.allowlist))
 
     def resolve(self, *segments: str | os.PathLike[str], must_exist: bool = False) -> Path:
         """Resolve segments inside the sandbox root, rejecting escapes."""
@@ -54,14 +56,6 @@ class Sandbox:
         return resolved
 
     def _is_allowed(self, target: Path) -> bool:
-        if _is_relative_to(target, self.root):
-            return True
-        return any(_is_relative_to(target, allowed) for allowed in self.allowlist)
-
-
-def _is_relative_to(path: Path, root: Path) -> bool:
-    try:
-        path.relative_to(root)
-    except ValueError:
-        return False
-    return True
+        # Both sides are already resolved, so containment is a prefix match on parts.
+        parts = target.parts
+        return any(parts[: len(allowed)] == allowed for allowed in self._allowed_parts)
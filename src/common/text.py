@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import re
+import string
 
 _SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+# ASCII bytes outside [a-z0-9]; bytes.translate deletes them in one C pass.
+_SLUG_DELETE = bytes(
+    code for code in range(128) if chr(code) not in string.ascii_lowercase + string.digits
+)
 
 
 def slugify(value: str) -> str:
     """Return a compact, lowercase slug using alphanumeric characters only."""
 
-    normalized = value.lower().strip()
-    normalized = _SLUG_PATTERN.sub("", normalized)
-    return normalized
+    normalized = value.lower()
+    if normalized.isascii():
+        return normalized.encode("ascii").translate(None, _SLUG_DELETE).decode("ascii")
+    return _SLUG_PATTERN.sub("", normalized)
@@ -1,7 +1,7 @@
 """Centralized version constants for artifacts and clusters."""
 from __future__ import annotations
 
-MAPPING_ARTIFACT_VERSION = "2.0.0"
+MAPPING_ARTIFACT_VERSION = "2.1.0"
 LEGACY_MAPPING_ARTIFACT_VERSION = "1.0.0"
 
 HEADER_CLUSTER_VERSION = "1.1.0"
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, List, Sequence, Tuple
+from typing import BinaryIO, Iterator, List, Sequence, Tuple
 
 BUFFER_LIMIT_BYTES = 1_048_576
+READ_BUFFER_BYTES = 1_048_576
 
 
 @dataclass(slots=True)
@@ -69,42 +70,54 @@ class BlockPlanner:
             buffer_bytes = 0
             yield block, captured
 
-        with path.open("rb") as handle:
-            for line_number, raw_line in enumerate(handle):
-                while current and line_number > current.end_line:
+        with path.open("rb", buffering=READ_BUFFER_BYTES) as handle:
+            line_number = 0
+            while current is not None:
+                if current.end_line < line_number:
                     yield from flush_buffer(current)
                     current = next(plan_iter, None)
-                if current is None:
+                    continue
+                if line_number < current.start_line:
+                    # Gaps between sampled blocks are skipped chunk-wise, not line by line.
+                    line_number += _skip_lines(handle, current.start_line - line_number)
+                    if line_number < current.start_line:
+                        break
+                raw_line = handle.readline()
+                if not raw_line:
                     break
-                if current.start_line <= line_number <= current.end_line:
-                    if buffer_bytes + len(raw_line) <= self.buffer_limit_bytes:
-                        buffer.append(raw_line.decode(encoding, errors=errors))
-                        buffer_bytes += len(raw_line)
-                if current is not None and line_number == current.end_line:
+                if buffer_bytes + len(raw_line) <= self.buffer_limit_bytes:
+                    buffer.append(raw_line.decode(encoding, errors=errors))
+                    buffer_bytes += len(raw_line)
+                if line_number == current.end_line:
                     yield from flush_buffer(current)
                     current = next(plan_iter, None)
-            if current is not None:
-                yield from flush_buffer(current)
-                current = next(plan_iter, None)
+                line_number += 1
+        if current is not None:
+            yield from flush_buffer(current)
         for remaining in plan_iter:
             yield remaining, []
 
     def _build_sample_indices(self, total_lines: int) -> List[int]:
+        """Bisect ``[0, total_lines - 1]`` until no gap between samples exceeds ``min_gap_lines``."""
+
         if total_lines <= 0:
             return []
         gap = max(1, self.min_gap_lines)
-        samples: set[int] = {0, max(0, total_lines - 1)}
-        changed = True
-        while changed:
-            changed = False
-            ordered = sorted(samples)
-            for left, right in zip(ordered, ordered[1:]):
-                if right - left > gap:
-                    mid = left + (right - left) // 2
-                    if mid not in samples:
-                        samples.add(mid)
-                        changed = True
-        return sorted(samples)
+        last = total_lines - 1
+        samples: List[int] = []
+        # Depth-first over intervals, left half first, so leaves come out in ascending order.
+        stack: List[Tuple[int, int]] = [(0, last)]
+        while stack:
+            left, right = stack.pop()
+            if right - left > gap:
+                mid = left + (right - left) // 2
+                stack.append((mid, right))
+                stack.append((left, mid))
+            else:
+                samples.append(left)
+        if last > 0:
+            samples.append(last)
+        return samples
 
     def _to_block(self, line_index: int, total_lines: int) -> Tuple[int, int]:
         half = self.block_size // 2
@@ -113,3 +126,24 @@ class BlockPlanner:
         end = min(total_lines - 1, start + self.block_size - 1)
         start = max(0, end - self.block_size + 1)
         return start, end
+
+
+def _skip_lines(handle: BinaryIO, count: int) -> int:
+    """Advance *handle* past ``count`` newline-terminated lines; return how many were skipped."""
+
+    remaining = count
+    while remaining > 0:
+        offset = handle.tell()
+        chunk = handle.read(READ_BUFFER_BYTES)
+        if not chunk:
+            break
+        newlines = chunk.count(b"\n")
+        if newlines < remaining:
+            remaining -= newlines
+            continue
+        position = -1
+        for _ in range(remaining):
+            position = chunk.index(b"\n", position + 1)
+        handle.seek(offset + position + 1)
+        return count
+    return count - remaining
@@ -4,21 +4,31 @@ from __future__ import annotations
 import csv
 import hashlib
 import math
+import re
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
 from common.models import ColumnProfileResult
 from core.headers.type_inference import classify_value
 
-# Supported date patterns; kept small to avoid heavy dependencies.
-_DATE_FORMATS = (
-    "%Y-%m-%d",
-    "%d.%m.%Y",
-    "%d-%m-%Y",
-    "%m/%d/%Y",
-    "%Y/%m/%d",
+try:  # pragma: no cover - optional accelerator, blake2b is the fallback
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None  # type: ignore[assignment]
+
+# Supported date layouts as (pattern, year/month/day group positions); kept small to avoid
+# heavy dependencies. Matching precompiled patterns and building the date directly avoids
+# strptime raising ValueError for every layout that does not apply.
+_DATE_LAYOUTS = (
+    (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"), (0, 1, 2)),
+    (re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})"), (2, 1, 0)),
+    (re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})"), (2, 1, 0)),
+    (re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})"), (2, 0, 1)),
+    (re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})"), (0, 1, 2)),
 )
 
 
@@ -34,8 +44,7 @@ def profile_file_columns(
     profiler = _ColumnProfiler(delimiter=delimiter)
     try:
         with path.open("r", encoding=encoding, errors=errors, newline="") as handle:
-            reader = csv.reader(handle, delimiter=delimiter)
-            for row in reader:
+            for row in _iter_rows(handle, delimiter):
                 if not row:
                     continue
                 if profiler.consume_header_if_needed(row):
@@ -46,6 +55,41 @@ def profile_file_columns(
     return profiler.finalize(file_id=path.as_posix())
 
 
+def _iter_rows(handle: TextIO, delimiter: str) -> Iterator[List[str]]:
+    """Split unquoted lines directly and hand off to ``csv.reader`` at the first quote."""
+
+    for line in handle:
+        if '"' in line:
+            yield from csv.reader(chain((line,), handle), delimiter=delimiter)
+            return
+        line = line.rstrip("\r\n")
+        # csv.reader yields [] for blank lines; mirror that so callers can skip them.
+        yield line.split(delimiter) if line else []
+
+
+def _blake2b_64(value: str) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8, usedforsecurity=False).digest()
+    return int.from_bytes(digest, "big", signed=False)
+
+
+# Profile buckets in result order; per-column counts are kept in a list indexed by these.
+BUCKET_NAMES = ("integer", "float", "text", "date", "null")
+BUCKET_INTEGER, BUCKET_FLOAT, BUCKET_TEXT, BUCKET_DATE, BUCKET_NULL = range(len(BUCKET_NAMES))
+_CATEGORY_BUCKETS = {
+    "integer": BUCKET_INTEGER,
+    "float": BUCKET_FLOAT,
+    "text": BUCKET_TEXT,
+    "date": BUCKET_DATE,
+    "empty": BUCKET_NULL,
+}
+
+# Distinct cell values remembered per column; low-cardinality columns skip re-classification.
+VALUE_CACHE_SIZE = 256
+
+# Sketches are never merged across processes, so the hash only has to be uniform.
+_hash64 = xxhash.xxh3_64_intdigest if xxhash is not None else _blake2b_64
+
+
 class HyperLogLogLite:
     """Approximate distinct counter inspired by HLL but tuned for tiny payloads."""
 
@@ -53,54 +97,73 @@ class HyperLogLogLite:
         self.precision = min(16, max(4, precision))
         self.register_count = 1 << self.precision
         self.registers = [0] * self.register_count
+        self._mask = self.register_count - 1
+        # rho(w) for the (64 - precision)-bit suffix w is _rank_base - w.bit_length().
+        self._rank_base = 64 - self.precision + 1
 
     def add(self, value: str) -> None:
         if not value:
             return
-        digest = hashlib.blake2b(
-            value.encode("utf-8"), digest_size=8, usedforsecurity=False
-        ).digest()
-        hashed = int.from_bytes(digest, "big", signed=False)
-        index = hashed & (self.register_count - 1)
-        w = hashed >> self.precision
-        leading = self._rho(w, 64 - self.precision)
+        hashed = _hash64(value)
+        index = hashed & self._mask
+        leading = self._rank_base - (hashed >> self.precision).bit_length()
         if leading > self.registers[index]:
             self.registers[index] = leading
 
     def estimate(self) -> int:
-        m = float(self.register_count)
-        alpha = 0.7213 / (1 + 1.079 / m)
-        indicator = sum(2.0 ** (-register) for register in self.registers)
-        if indicator == 0:
+        """Estimate the distinct count with Ertl's improved raw estimator.
+
+        Unlike the classic HLL estimate with a linear-counting switch, this stays
+        unbiased across the small/mid range without empirical bias tables
+        (O. Ertl, "New cardinality estimation algorithms for HyperLogLog sketches", 2017).
+        """
+
+        m = self.register_count
+        q = 64 - self.precision
+        histogram = Counter(self.registers)
+        if histogram[0] == m:
             return 0
-        raw = alpha * (m * m) / indicator
-        # Small-range correction (linear counting) improves precision for <= 2.5m
-        zero_registers = self.registers.count(0)
-        if zero_registers and raw < 2.5 * m:
-            return int(m * math.log(m / zero_registers))
-        return int(raw)
-
-    @staticmethod
-    def _rho(value: int, bits: int) -> int:
-        if value == 0:
-            return bits + 1
-        leading = 1
-        while leading <= bits and ((value >> (bits - leading)) & 1) == 0:
-            leading += 1
-        return leading
+        z = m * _hll_tau(1.0 - histogram[q + 1] / m)
+        for rank in range(q, 0, -1):
+            z = 0.5 * (z + histogram[rank])
+        z += m * _hll_sigma(histogram[0] / m)
+        return int(round(m * m / (2.0 * math.log(2.0) * z)))
+
+
+def _hll_sigma(x: float) -> float:
+    if x == 1.0:
+        return math.inf
+    y = 1.0
+    z = x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y += y
+        if z == previous:
+            return z
+
+
+def _hll_tau(x: float) -> float:
+    if x == 0.0 or x == 1.0:
+        return 0.0
+    y = 1.0
+    z = 1.0 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1.0 - x) ** 2 * y
+        if z == previous:
+            return z / 3.0
 
 
 @dataclass(slots=True)
 class ColumnProfileMetrics:
     index: int
     header: str
-    type_distribution: Dict[str, int] = field(default_factory=lambda: {
-        "integer": 0,
-        "float": 0,
-        "text": 0,
-        "date": 0,
-        "null": 0,
-    })
+    # Counts indexed by the BUCKET_* constants; converted to a dict in to_result().
+    type_counts: List[int] = field(default_factory=lambda: [0] * len(BUCKET_NAMES))
     total_values: int = 0
     null_count: int = 0
     numeric_min: Optional[float] = None
@@ -108,38 +171,44 @@ class ColumnProfileMetrics:
     date_min: Optional[str] = None
     date_max: Optional[str] = None
     distinct_counter: HyperLogLogLite = field(default_factory=HyperLogLogLite)
+    _value_cache: Dict[str, Tuple[int, Optional[float], Optional[str]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def observe(self, raw_value: str) -> None:
         value = raw_value.strip()
-        bucket = classify_value(value)
-        mapped_bucket = _map_bucket(bucket)
-        self.type_distribution[mapped_bucket] = self.type_distribution.get(mapped_bucket, 0) + 1
         self.total_values += 1
-        if mapped_bucket == "null":
+        cached = self._value_cache.get(value)
+        if cached is None:
+            cached = _classify_cell(value)
+            if len(self._value_cache) >= VALUE_CACHE_SIZE:
+                del self._value_cache[next(iter(self._value_cache))]
+            self._value_cache[value] = cached
+            if cached[0] != BUCKET_NULL:
+                # Re-adding an evicted value later is harmless: sketch registers only grow.
+                self.distinct_counter.add(value)
+        bucket, number, iso_date = cached
+        self.type_counts[bucket] += 1
+        if bucket == BUCKET_NULL:
             self.null_count += 1
             return
-        self.distinct_counter.add(value)
-        if mapped_bucket in {"integer", "float"}:
-            maybe = _to_float(value)
-            if maybe is not None:
-                if self.numeric_min is None or maybe < self.numeric_min:
-                    self.numeric_min = maybe
-                if self.numeric_max is None or maybe > self.numeric_max:
-                    self.numeric_max = maybe
-        elif mapped_bucket == "date":
-            iso_date = _to_iso_date(value)
-            if iso_date:
-                if self.date_min is None or iso_date < self.date_min:
-                    self.date_min = iso_date
-                if self.date_max is None or iso_date > self.date_max:
-                    self.date_max = iso_date
+        if number is not None:
+            if self.numeric_min is None or number < self.numeric_min:
+                self.numeric_min = number
+            if self.numeric_max is None or number > self.numeric_max:
+                self.numeric_max = number
+        elif iso_date is not None:
+            if self.date_min is None or iso_date < self.date_min:
+                self.date_min = iso_date
+            if self.date_max is None or iso_date > self.date_max:
+                self.date_max = iso_date
 
     def to_result(self, file_id: str) -> ColumnProfileResult:
         return ColumnProfileResult(
             file_id=file_id,
             column_index=self.index,
             header=self.header,
-            type_distribution=dict(self.type_distribution),
+            type_distribution=dict(zip(BUCKET_NAMES, self.type_counts)),
             unique_estimate=self.distinct_counter.estimate(),
             null_count=self.null_count,
             total_values=self.total_values,
@@ -189,12 +258,19 @@ class _ColumnProfiler:
         return results
 
 
-def _map_bucket(bucket: str) -> str:
-    if bucket == "empty":
-        return "null"
-    if bucket in {"integer", "float", "text", "date"}:
-        return bucket
-    return "text"
+def _classify_cell(value: str) -> Tuple[int, Optional[float], Optional[str]]:
+    """Return ``(bucket index, numeric value, ISO date)`` for a stripped cell value."""
+
+    bucket = _map_bucket(classify_value(value))
+    if bucket == BUCKET_INTEGER or bucket == BUCKET_FLOAT:
+        return bucket, _to_float(value), None
+    if bucket == BUCKET_DATE:
+        return bucket, None, _to_iso_date(value)
+    return bucket, None, None
+
+
+def _map_bucket(category: str) -> int:
+    return _CATEGORY_BUCKETS.get(category, BUCKET_TEXT)
 
 
 def _to_float(value: str) -> Optional[float]:
@@ -216,10 +292,13 @@ def _to_iso_date(value: str) -> Optional[str]:
         return parsed.date().isoformat()
     except ValueError:
         pass
-    for pattern in _DATE_FORMATS:
+    for pattern, (year, month, day) in _DATE_LAYOUTS:
+        match = pattern.fullmatch(value)
+        if match is None:
+            continue
+        parts = match.groups()
         try:
-            parsed = datetime.strptime(value, pattern)
-            return parsed.date().isoformat()
+            return date(int(parts[year]), int(parts[month]), int(parts[day])).isoformat()
         except ValueError:
             continue
     return None
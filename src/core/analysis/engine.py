@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import time
-from collections import Counter, deque
+from collections import Counter
 from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Sequence, Tuple
@@ -47,7 +47,12 @@ def detect_file_encoding(path: Path, default: str = "utf-8") -> str:
     return default
 
 class AdaptiveThrottle:
-    """Simple moving-average based throttler that adjusts concurrency."""
+    """Adjusts concurrency from an EWMA of task durations, growing fast and shrinking slowly.
+
+    A single slow file only nudges the average, and the limit drops only after
+    ``shrink_after`` consecutive slow reports, so the limit does not ping-pong
+    between two values the way a per-sample adjustment does.
+    """
 
     def __init__(
         self,
@@ -56,31 +61,47 @@ class AdaptiveThrottle:
         min_workers: int = 1,
         slow_threshold: float = 4.0,
         fast_threshold: float = 1.5,
-        window: int = 8,
+        smoothing: float = 0.3,
+        shrink_after: int = 3,
     ) -> None:
         self.max_workers = max_workers
         self.min_workers = min_workers
         self.slow_threshold = slow_threshold
         self.fast_threshold = fast_threshold
-        self.samples: deque[float] = deque(maxlen=window)
+        self.smoothing = min(1.0, max(0.0, smoothing))
+        self.shrink_after = max(1, shrink_after)
+        self.average: Optional[float] = None
+        self._slow_reports = 0
         self._limit = max_workers
 
     def report(self, duration: float) -> None:
-        self.samples.append(duration)
-        avg = sum(self.samples) / len(self.samples)
-        if avg > self.slow_threshold and self._limit > self.min_workers:
-            self._limit -= 1
-        elif avg < self.fast_threshold and self._limit < self.max_workers:
+        if self.average is None:
+            self.average = duration
+        else:
+            self.average += self.smoothing * (duration - self.average)
+        if self.average > self.slow_threshold:
+            self._slow_reports += 1
+            if self._slow_reports >= self.shrink_after and self._limit > self.min_workers:
+                self._limit -= 1
+                self._slow_reports = 0
+            return
+        self._slow_reports = 0
+        if self.average < self.fast_threshold and self._limit < self.max_workers:
             self._limit += 1
 
     @property
     def limit(self) -> int:
         return max(self.min_workers, min(self.max_workers, self._limit))
 
+
+DELIMITER_CANDIDATES = (",", ";", "\t", "|")
+
+
 def detect_delimiter(line: str) -> str:
-    candidates = [",", ";", "\t", "|"]
-    counts = {c: line.count(c) for c in candidates}
-    return max(counts, key=counts.get) if line else ","
+    if not line:
+        return ","
+    # str.count is a C-level scan per candidate; first candidate wins ties, as before.
+    return max(DELIMITER_CANDIDATES, key=line.count)
 
 
 def normalize_value(value: str) -> str:
@@ -96,21 +117,28 @@ def build_signature(block_lines: List[str], sample_cap: int, *, encoding: str) -
     sample_lines = block_lines[:MAX_SIGNATURE_SAMPLE_LINES]
     header_sample = first_line if first_line else None
 
-    column_stats: Dict[int, ColumnStats] = {}
+    # Column indices are dense (0..width-1), so build into a list and key it once at the end.
+    column_stats: List[ColumnStats] = []
     col_count_counter: Counter[int] = Counter()
+    # Sampled values repeat heavily (codes, flags, dates); normalize and classify each once.
+    classified: Dict[str, Tuple[str, str]] = {}
 
     for raw_line in sample_lines:
         line = raw_line.rstrip("\n\r")
         parts = line.split(delimiter)
         col_count_counter[len(parts)] += 1
-        for idx, value in enumerate(parts):
-            stats = column_stats.setdefault(idx, ColumnStats(index=idx))
+        while len(column_stats) < len(parts):
+            column_stats.append(ColumnStats(index=len(column_stats)))
+        for stats, value in zip(column_stats, parts):
             stats.sample_count += 1
-            cleaned = normalize_value(value)
+            known = classified.get(value)
+            if known is None:
+                cleaned = normalize_value(value)
+                known = classified[value] = (cleaned, classify_value(cleaned))
+            cleaned, category = known
             if cleaned and len(stats.sample_values) < sample_cap:
                 stats.sample_values.add(cleaned)
             update_type_flags(cleaned, stats)
-            category = classify_value(cleaned)
             stats.type_counts[category] = stats.type_counts.get(category, 0) + 1
 
     column_count = col_count_counter.most_common(1)[0][0] if col_count_counter else 0
@@ -118,24 +146,32 @@ def build_signature(block_lines: List[str], sample_cap: int, *, encoding: str) -
         delimiter=delimiter,
         column_count=column_count,
         header_sample=header_sample,
-        columns=column_stats,
+        columns=dict(enumerate(column_stats)),
     )
 
 
+_NUMERIC_CHARS = frozenset("0123456789.,+-eE \t")
+_BOOL_VALUES = frozenset({"true", "false", "0", "1", "yes", "no"})
+
+
 def update_type_flags(value: str, stats: ColumnStats) -> None:
     if not value:
         return
 
     if stats.maybe_numeric:
-        try:
-            float(value.replace(",", "."))
-        except ValueError:
+        # Disprove with a character check first so text cells never reach float().
+        if not _NUMERIC_CHARS.issuperset(value):
             stats.maybe_numeric = False
+        elif not value.isdigit():
+            try:
+                float(value.replace(",", "."))
+            except ValueError:
+                stats.maybe_numeric = False
 
-    if stats.maybe_bool and value.lower() not in {"true", "false", "0", "1", "yes", "no"}:
+    if stats.maybe_bool and (len(value) > 5 or value.lower() not in _BOOL_VALUES):
         stats.maybe_bool = False
 
-    if stats.maybe_date and not any(char in value for char in {"-", "/", "."}):
+    if stats.maybe_date and "-" not in value and "/" not in value and "." not in value:
         stats.maybe_date = False
 
 
@@ -234,6 +270,28 @@ class AnalysisEngine:
         self.encoding = config.global_settings.encoding
         self.errors = error_mode_from_policy(config.global_settings.error_policy)
         self.progress_logger = ProgressLogger(progress_log) if progress_log else None
+        # Created on first parallel run and reused by later analyze_files() calls.
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started, and close the progress log."""
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self.progress_logger:
+            self.progress_logger.close()
+
+    def __enter__(self) -> "AnalysisEngine":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        return self._pool
 
     def analyze_files(
         self,
@@ -243,15 +301,26 @@ class AnalysisEngine:
     ) -> List[FileAnalysisResult]:
         if not files:
             return []
+        try:
+            return self._analyze_files(files, progress_callback)
+        finally:
+            if self.progress_logger:
+                self.progress_logger.close()
 
+    def _analyze_files(
+        self,
+        files: Sequence[Path],
+        progress_callback: ProgressCallback,
+    ) -> List[FileAnalysisResult]:
         max_workers = max(1, self.config.profile.max_parallel_files)
-        order_map = {path.resolve(): idx for idx, path in enumerate(files)}
+        resolved_files = [path.resolve() for path in files]
+        order_map = {path: idx for idx, path in enumerate(resolved_files)}
         tasks = []
-        for path in files:
+        for path, resolved in zip(files, resolved_files):
             detected_enc = detect_file_encoding(path, default=self.encoding)
             tasks.append(
                 (
-                    str(path.resolve()),
+                    str(resolved),
                     detected_enc,
                     self.errors,
                     self.config.profile.block_size,
@@ -279,7 +348,8 @@ class AnalysisEngine:
             future = pool.submit(_worker_entry, task_tuple)
             in_flight[future] = (Path(task_tuple[0]), time.perf_counter())
 
-        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        pool = self._get_pool(max_workers)
+        try:
             # Prime the pool respecting the current throttle limit
             while len(in_flight) < throttle.limit:
                 try:
@@ -301,7 +371,13 @@ class AnalysisEngine:
                         submit_task(next(task_iter))
                     except StopIteration:
                         break
-        results.sort(key=lambda item: order_map.get(item.file_path.resolve(), 0))
+        except BaseException:
+            # A failed run may have broken the pool; drop it so the next call starts fresh.
+            self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        # Workers receive resolved path strings, so result paths are already resolved.
+        results.sort(key=lambda item: order_map.get(item.file_path, 0))
         return results
 
     def _emit_progress(
@@ -3,13 +3,14 @@ from __future__ import annotations
 
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
+import heapq
 from pathlib import Path
 import re
 from typing import Dict, Iterable, List, Sequence, Set, Tuple
 import unicodedata
 
 from common.models import (
-    ColumnProfileResult,
     ColumnStats,
     FileAnalysisResult,
     FileBlock,
@@ -19,6 +20,11 @@ from common.models import (
 from core.headers.metadata import HeaderMetadata, build_header_metadata
 from core.headers.type_inference import ensure_type_buckets
 
+try:  # pragma: no cover - optional accelerator, the pure-Python ratio is the fallback
+    from rapidfuzz.distance import Levenshtein as _rapidfuzz_levenshtein
+except ImportError:  # pragma: no cover
+    _rapidfuzz_levenshtein = None  # type: ignore[assignment]
+
 _SLUG_CLEANUP = re.compile(r"[^a-z0-9]+")
 _VOWEL_TABLE = str.maketrans("", "", "aeiouy")
 
@@ -63,6 +69,11 @@ _CYRILLIC_LATIN = {
 }
 _TRANLIT_TABLE = str.maketrans({**_CYRILLIC_LATIN})
 
+# _similarity_score weights n-gram overlap by 0.3, so without a shared n-gram it tops out here.
+_MAX_SCORE_WITHOUT_NGRAMS = 0.7
+# Slugs up to this length link to any slug they prefix (see _should_link).
+_SHORT_SLUG_LENGTH = 4
+
 _DEFAULT_SYNONYM_SETS: Sequence[Sequence[str]] = (
     ("month", "months", "mon", "mth", "місяць", "міс"),
     ("city", "city_name", "town", "місто"),
@@ -74,6 +85,8 @@ def _transliterate(value: str) -> str:
     return value.translate(_TRANLIT_TABLE)
 
 
+# Header names repeat across files, blocks and synonym tables; slug each distinct one once.
+@lru_cache(maxsize=4096)
 def _canonical_slug(text: str) -> str:
     lowered = text.lower()
     transliterated = _transliterate(lowered)
@@ -100,6 +113,10 @@ def _block_row_count(block: FileBlock) -> int:
     return (block.end_line - block.start_line) + 1
 
 
+def _smallest_values(values: Set[str], count: int) -> Set[str]:
+    return set(heapq.nsmallest(count, values))
+
+
 def _merge_counts(target: Dict[str, int], source: Dict[str, int]) -> None:
     for key, value in source.items():
         target[key] = target.get(key, 0) + int(value)
@@ -113,20 +130,23 @@ class VariantAccumulator:
     sample_values: set[str] = field(default_factory=set)
     detected_types: Dict[str, int] = field(default_factory=dict)
     row_count: int = 0
+    # Only the sample_cap smallest values survive clipping, so larger ones can be dropped early.
+    sample_cap: int = 0
 
     def update(self, stats: ColumnStats | None, rows: int) -> None:
         if stats:
             self.sample_values.update(stats.sample_values)
+            if self.sample_cap and len(self.sample_values) > 2 * self.sample_cap:
+                self.sample_values = _smallest_values(self.sample_values, self.sample_cap)
             _merge_counts(self.detected_types, stats.type_counts)
         self.row_count += max(0, rows)
 
-    def merge_profile(self, profile: ColumnProfileResult | None) -> None:
-        if not profile:
-            return
-        normalized = _normalize_profile_counts(profile.type_distribution)
-        _merge_counts(self.detected_types, normalized)
-        if profile.total_values:
-            self.row_count = max(self.row_count, profile.total_values)
+    def merge_profile(self, type_counts: Dict[str, int], total_values: int) -> None:
+        """Merge a column profile already normalized with ``_normalize_profile_counts``."""
+
+        _merge_counts(self.detected_types, type_counts)
+        if total_values:
+            self.row_count = max(self.row_count, total_values)
 
 
 @dataclass(slots=True)
@@ -199,31 +219,39 @@ class HeaderClusterizer:
         for result in results:
             headers = self._resolved_headers(result)
             max_columns = len(headers)
+            # Profiles are per file but merged for every block; normalize each one once.
             profile_lookup = {
-                profile.column_index: profile
+                profile.column_index: (
+                    _normalize_profile_counts(profile.type_distribution),
+                    profile.total_values,
+                )
                 for profile in result.column_profiles
             }
             for block in result.blocks:
                 column_count = block.signature.column_count or max_columns
                 row_count = _block_row_count(block)
+                columns = block.signature.columns
                 for idx in range(max(column_count, max_columns)):
                     raw_name = headers[idx] if idx < len(headers) else f"column_{idx + 1}"
                     key = (block.file_path, idx)
                     accumulator = accumulators.get(key)
                     if accumulator is None:
-                        accumulator = VariantAccumulator(block.file_path, idx, raw_name)
+                        accumulator = VariantAccumulator(
+                            block.file_path, idx, raw_name, sample_cap=self.sample_clip
+                        )
                         accumulators[key] = accumulator
                     elif not accumulator.raw_name.strip() and raw_name.strip():
                         accumulator.raw_name = raw_name
-                    stats = block.signature.columns.get(idx)
-                    accumulator.update(stats, row_count)
-                    accumulator.merge_profile(profile_lookup.get(idx))
+                    accumulator.update(columns.get(idx), row_count)
+                    profile = profile_lookup.get(idx)
+                    if profile is not None:
+                        accumulator.merge_profile(*profile)
         variants: List[HeaderVariant] = []
         for accumulator in accumulators.values():
             normalized = _canonical_slug(accumulator.raw_name) or accumulator.raw_name.strip() or f"column_{accumulator.column_index + 1}"
             sample_values = accumulator.sample_values
             if len(sample_values) > self.sample_clip:
-                sample_values = set(sorted(sample_values)[: self.sample_clip])
+                sample_values = _smallest_values(sample_values, self.sample_clip)
             detected_types = ensure_type_buckets(dict(accumulator.detected_types))
             variants.append(
                 HeaderVariant(
@@ -246,25 +274,24 @@ class HeaderClusterizer:
         nodes: Dict[str, HeaderNode] = {}
         for variant in variants:
             key = _metadata_key(variant.raw_name, variant.column_index)
-            slug = _canonical_slug(variant.raw_name)
-            alias = self.synonym_map.get(slug, slug)
-            translit = slug.replace(" ", "")
-            skeleton = _skeleton(slug)
-            type_profile = profile_lookup.get(key)
-            if type_profile is None:
-                type_profile = ensure_type_buckets(dict(variant.detected_types))
             node = nodes.get(key)
             if node is None:
+                # Slug-derived fields depend only on the key's first variant; build them once.
+                slug = _canonical_slug(variant.raw_name)
+                translit = slug.replace(" ", "")
+                type_profile = profile_lookup.get(key)
+                if type_profile is None:
+                    type_profile = ensure_type_buckets(dict(variant.detected_types))
                 node = HeaderNode(
                     key=key,
                     display_name=variant.raw_name,
                     slug=slug,
-                    alias=alias,
+                    alias=self.synonym_map.get(slug, slug),
                     translit=translit,
-                    skeleton=skeleton,
+                    skeleton=_skeleton(slug),
                     type_profile=type_profile,
                     tokens=_tokenize(slug),
-                    ngrams=_ngram_set(slug.replace(" ", ""), self.ngram_size),
+                    ngrams=_ngram_set(translit, self.ngram_size),
                 )
                 nodes[key] = node
             node.add_variant(variant)
@@ -273,43 +300,88 @@ class HeaderClusterizer:
     def _link_nodes(self, nodes: List[HeaderNode]) -> List[List[HeaderNode]]:
         if not nodes:
             return []
-        parent = {node.key: node.key for node in nodes}
-
-        def find(key: str) -> str:
-            while parent[key] != key:
-                parent[key] = parent[parent[key]]
-                key = parent[key]
-            return key
-
-        def union(a: str, b: str) -> None:
+        # Union-find over node positions, with union by rank and full path compression.
+        parent = list(range(len(nodes)))
+        rank = [0] * len(nodes)
+
+        def find(idx: int) -> int:
+            root = idx
+            while parent[root] != root:
+                root = parent[root]
+            while parent[idx] != root:
+                parent[idx], idx = root, parent[idx]
+            return root
+
+        def union(a: int, b: int) -> None:
             root_a = find(a)
             root_b = find(b)
             if root_a == root_b:
                 return
+            if rank[root_a] < rank[root_b]:
+                root_a, root_b = root_b, root_a
             parent[root_b] = root_a
+            if rank[root_a] == rank[root_b]:
+                rank[root_a] += 1
 
-        alias_buckets: Dict[str, List[str]] = defaultdict(list)
-        for node in nodes:
+        alias_buckets: Dict[str, List[int]] = defaultdict(list)
+        for idx, node in enumerate(nodes):
             if node.alias:
-                alias_buckets[node.alias].append(node.key)
-        for keys in alias_buckets.values():
-            base = keys[0]
-            for other in keys[1:]:
+                alias_buckets[node.alias].append(idx)
+        for members in alias_buckets.values():
+            base = members[0]
+            for other in members[1:]:
                 union(base, other)
 
-        total = len(nodes)
-        for idx in range(total):
-            for jdx in range(idx + 1, total):
-                left = nodes[idx]
-                right = nodes[jdx]
-                if self._should_link(left, right):
-                    union(left.key, right.key)
-
-        grouped: Dict[str, List[HeaderNode]] = defaultdict(list)
-        for node in nodes:
-            grouped[find(node.key)].append(node)
+        for idx, jdx in self._candidate_pairs(nodes):
+            # Pairs already in one group cannot change the result; skip the similarity work.
+            if find(idx) != find(jdx) and self._should_link(nodes[idx], nodes[jdx]):
+                union(idx, jdx)
+
+        grouped: Dict[int, List[HeaderNode]] = defaultdict(list)
+        for idx, node in enumerate(nodes):
+            grouped[find(idx)].append(node)
         return list(grouped.values())
 
+    def _candidate_pairs(self, nodes: Sequence[HeaderNode]) -> List[Tuple[int, int]]:
+        """Return the index pairs that can pass ``_should_link`` other than by alias.
+
+        Equal aliases are unioned up front. Beyond that, a pair can only link if its slugs
+        share an n-gram (similarity above 0.7 needs the n-gram term, and equal translits
+        share all n-grams), share a skeleton, or a short slug prefixes the other. Nodes
+        are bucketed on those keys so dissimilar headers are never compared.
+        """
+
+        total = len(nodes)
+        if self.similarity_threshold <= _MAX_SCORE_WITHOUT_NGRAMS:
+            return [(idx, jdx) for idx in range(total) for jdx in range(idx + 1, total)]
+        buckets: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        for idx, node in enumerate(nodes):
+            if not node.slug:
+                continue
+            for gram in node.ngrams:
+                buckets[("ngram", gram)].append(idx)
+            if len(node.skeleton) >= 3:
+                buckets[("skeleton", node.skeleton)].append(idx)
+            for size in range(1, min(len(node.slug), _SHORT_SLUG_LENGTH) + 1):
+                buckets[("prefix", node.slug[:size])].append(idx)
+        pairs: Set[Tuple[int, int]] = set()
+        for (kind, value), members in buckets.items():
+            if len(members) < 2:
+                continue
+            if kind == "prefix":
+                # Only slugs of at most _SHORT_SLUG_LENGTH may link by prefix, and only
+                # with slugs that start with them, i.e. members of their own prefix bucket.
+                anchors = [idx for idx in members if nodes[idx].slug == value]
+                for anchor in anchors:
+                    for other in members:
+                        if other != anchor:
+                            pairs.add((min(anchor, other), max(anchor, other)))
+                continue
+            for position, idx in enumerate(members):
+                for jdx in members[position + 1 :]:
+                    pairs.add((idx, jdx))
+        return sorted(pairs)
+
     def _should_link(self, left: HeaderNode, right: HeaderNode) -> bool:
         if left.alias and left.alias == right.alias:
             return True
@@ -391,7 +463,7 @@ class HeaderClusterizer:
         return headers or ["column_1"]
 
     def _similarity_score(self, left: HeaderNode, right: HeaderNode) -> float:
-        lev = _levenshtein_ratio(left.slug, right.slug)
+        lev = _slug_similarity(left.slug, right.slug)
         ngram = _jaccard(left.ngrams, right.ngrams)
         token = _token_overlap(left.tokens, right.tokens)
         return 0.5 * lev + 0.3 * ngram + 0.2 * token
@@ -460,6 +532,14 @@ def _levenshtein_ratio(left: str, right: str) -> float:
     return 1.0 - distance / max(len_left, len_right)
 
 
+# rapidfuzz's normalized_similarity is the same 1 - distance / max(len) ratio, computed in C++.
+_slug_similarity = (
+    _rapidfuzz_levenshtein.normalized_similarity
+    if _rapidfuzz_levenshtein is not None
+    else _levenshtein_ratio
+)
+
+
 def _jaccard(left: Set[str], right: Set[str]) -> float:
     if not left and not right:
         return 1.0
@@ -9,6 +9,7 @@ TYPE_BUCKETS: Final[tuple[str, ...]] = ("date", "integer", "float", "text", "emp
 _DATE_PATTERN = re.compile(r"\b\d{1,4}[./-]\d{1,2}[./-]\d{1,4}\b")
 _INT_PATTERN = re.compile(r"^[+-]?\d+$")
 _FLOAT_PATTERN = re.compile(r"^[+-]?(?:\d+[.,]\d+|\d+\.\d*|\d*[.,]\d+)$")
+_NUMBER_LEADS = frozenset("+-.,")
 
 
 def classify_value(value: str) -> str:
@@ -19,8 +20,18 @@ def classify_value(value: str) -> str:
     cleaned = value.strip()
     if not cleaned:
         return "empty"
-    if _DATE_PATTERN.search(cleaned):
+    # C-level character-class checks settle the most common cells without the regex VM:
+    # all-digit cells cannot contain a date separator, all-letter cells contain no digits.
+    if cleaned.isdecimal():
+        return "integer"
+    if cleaned.isalpha():
+        return "text"
+    # Every date layout needs a separator, and numbers start with a sign, digit or decimal mark.
+    if ("-" in cleaned or "/" in cleaned or "." in cleaned) and _DATE_PATTERN.search(cleaned):
         return "date"
+    first = cleaned[0]
+    if not (first.isdecimal() or first in _NUMBER_LEADS):
+        return "text"
     if _INT_PATTERN.fullmatch(cleaned):
         return "integer"
     normalized = cleaned.replace(",", ".")
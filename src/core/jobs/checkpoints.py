@@ -22,7 +22,7 @@ class CheckpointRegistry:
             if not path.exists():
                 return {}
             try:
-                data = json.loads(path.read_text(encoding="utf-8"))
+                data = json.loads(path.read_bytes())
             except json.JSONDecodeError:
                 return {}
         return data if isinstance(data, dict) else {}
@@ -17,6 +17,7 @@ from uuid import uuid4
 
 from common.config import error_mode_from_policy
 from common.models import (
+    CanonicalColumnSpec,
     CanonicalSchema,
     CanonicalSchemaRegistry,
     ColumnProfileResult,
@@ -564,6 +565,7 @@ class CanonicalValidator:
         self._schema = schema
         self._canonical_schema = canonical_schema
         self._column_index = self._build_index(schema)
+        self._checks = self._build_checks(canonical_schema)
         self.missing_required = 0
         self.type_mismatches = 0
 
@@ -571,11 +573,7 @@ class CanonicalValidator:
         if self._canonical_schema is None:
             return
         width = len(values)
-        for spec in self._canonical_schema.columns:
-            slug = slugify(spec.name)
-            if not slug:
-                continue
-            column_index = self._column_index.get(slug)
+        for spec, column_index in self._checks:
             value = values[column_index] if column_index is not None and column_index < width else ""
             if not value.strip():
                 if spec.required and not spec.allow_null:
@@ -587,6 +585,21 @@ class CanonicalValidator:
             if not self._value_matches_type(spec, value):
                 self.type_mismatches += 1
 
+    def _build_checks(
+        self, canonical_schema: CanonicalSchema | None
+    ) -> List[Tuple[CanonicalColumnSpec, Optional[int]]]:
+        """Resolve each spec's column index once per job instead of once per row."""
+
+        if canonical_schema is None:
+            return []
+        checks: List[Tuple[CanonicalColumnSpec, Optional[int]]] = []
+        for spec in canonical_schema.columns:
+            slug = slugify(spec.name)
+            if not slug:
+                continue
+            checks.append((spec, self._column_index.get(slug)))
+        return checks
+
     def _build_index(self, schema: SchemaDefinition) -> Dict[str, int]:
         mapping: Dict[str, int] = {}
         for column in schema.columns:
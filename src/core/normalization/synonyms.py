@@ -24,8 +24,7 @@ class SynonymDictionary:
     def from_file(cls, path: Path) -> "SynonymDictionary":
         if not path.exists():
             return cls.empty()
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = json.loads(path.read_bytes())
         return cls.from_mapping(data)
 
     @classmethod
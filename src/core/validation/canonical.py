@@ -21,8 +21,7 @@ def load_canonical_registry(path: Path | str | None) -> CanonicalSchemaRegistry:
     schema_path = Path(path)
     if not schema_path.exists():
         return registry
-    with schema_path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = json.loads(schema_path.read_bytes())
     for payload in _iter_schema_payloads(raw):
         registry.register(CanonicalSchema.from_dict(payload))
     return registry
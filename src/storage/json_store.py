@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, Iterable, List
 from uuid import UUID
 
-from common.mapping_serialization import mapping_from_dict, mapping_to_dict
+from common.mapping_serialization import mapping_from_json_bytes, mapping_to_json_bytes
 from common.models import ColumnProfile, MappingConfig, SchemaStats
 
 
@@ -18,15 +18,13 @@ def save_mapping_config(
 ) -> None:
     """Serialize mapping config to JSON with optional sample values."""
 
-    data = mapping_to_dict(mapping, include_samples=include_samples)
+    data = mapping_to_json_bytes(mapping, include_samples=include_samples, indent=True)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    path.write_bytes(data)
 
 
 def load_mapping_config(path: Path) -> MappingConfig:
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    return mapping_from_dict(data)
+    return mapping_from_json_bytes(path.read_bytes())
 
 
 
@@ -38,8 +36,7 @@ def save_schema_stats(stats: Iterable[SchemaStats], path: Path) -> None:
 
 
 def load_schema_stats(path: Path) -> List[SchemaStats]:
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = json.loads(path.read_bytes())
     return [deserialize_schema_stats(item) for item in data]
 
 
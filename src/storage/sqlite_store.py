@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import sys
 import time
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence
@@ -663,8 +664,8 @@ def fetch_job_progress_events(
         for row in cursor.fetchall():
             events.append(
                 JobProgressEvent(
-                    schema_id=row[0],
-                    schema_name=row[1],
+                    schema_id=sys.intern(row[0]),
+                    schema_name=sys.intern(row[1]) if row[1] is not None else None,
                     file_path=Path(row[2]),
                     processed_rows=row[3],
                     total_rows=row[4],
@@ -5,6 +5,7 @@ import argparse
 import json
 import time
 from collections import Counter
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Iterable, List, Sequence
@@ -98,20 +99,20 @@ def command_analyze(args: argparse.Namespace) -> None:
     progress_log = Path(args.progress_log) if args.progress_log else None
 
     # Try utf-8 first, fallback to cp1251 if decode error occurs
-    engine = AnalysisEngine(runtime, progress_log=progress_log)
     print(
         f"Starting analysis for {len(files)} file(s) using profile '{args.profile}' "
         f"(block_size={runtime.profile.block_size}, parallel={runtime.profile.max_parallel_files})"
     )
     print(f"[analyze] Using encoding: {runtime.global_settings.encoding}")
     try:
-        results: List[FileAnalysisResult] = engine.analyze_files(files, progress_callback=render_progress)
+        with AnalysisEngine(runtime, progress_log=progress_log) as engine:
+            results: List[FileAnalysisResult] = engine.analyze_files(files, progress_callback=render_progress)
     except UnicodeDecodeError:
         print("UnicodeDecodeError: retrying with cp1251 encoding...")
-        runtime.global_settings.encoding = "cp1251"
+        runtime = replace(runtime, global_settings=replace(runtime.global_settings, encoding="cp1251"))
         print(f"[analyze] Fallback encoding: cp1251")
-        engine = AnalysisEngine(runtime, progress_log=progress_log)
-        results: List[FileAnalysisResult] = engine.analyze_files(files, progress_callback=render_progress)
+        with AnalysisEngine(runtime, progress_log=progress_log) as engine:
+            results = engine.analyze_files(files, progress_callback=render_progress)
 
     all_blocks = []
     all_column_profiles = []
@@ -161,12 +162,12 @@ def command_benchmark(args: argparse.Namespace) -> None:
         raise SystemExit("No input files found for benchmark.")
 
     runtime = load_runtime_config(profile=args.profile)
-    engine = AnalysisEngine(runtime)
     recorder = BenchmarkRecorder(Path(args.log))
 
-    start = time.perf_counter()
-    results = engine.analyze_files(files)
-    duration = time.perf_counter() - start
+    with AnalysisEngine(runtime) as engine:
+        start = time.perf_counter()
+        results = engine.analyze_files(files)
+        duration = time.perf_counter() - start
     total_rows = sum(result.total_lines for result in results)
     throughput = total_rows / duration if duration else 0.0
     recorder.record(
@@ -358,7 +359,7 @@ def command_materialize(args: argparse.Namespace) -> None:
         completed = True
     except UnicodeDecodeError:
         print("UnicodeDecodeError: retrying materialization with cp1251 encoding...")
-        runtime.global_settings.encoding = "cp1251"
+        runtime = replace(runtime, global_settings=replace(runtime.global_settings, encoding="cp1251"))
         print(f"[materialize] Fallback encoding: cp1251")
         job_tracker = JobStateMachine(
             job_id,
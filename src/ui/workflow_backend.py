@@ -50,8 +50,8 @@ def run_batch_workflow(input_folder: str, output_folder: str, output_format: str
     resource_manager = ResourceManager(runtime.profile.resource_limits)
 
     # Analyze files
-    engine = AnalysisEngine(runtime)
-    results = engine.analyze_files(files)
+    with AnalysisEngine(runtime) as engine:
+        results = engine.analyze_files(files)
     all_blocks = []
     all_column_profiles = []
     for result in results:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from common.models import ColumnStats
 from core.analysis.block_planner import BlockPlanner
+from core.analysis.engine import AdaptiveThrottle, build_signature, update_type_flags
 from core.analysis.line_counter import LineCounter
 
 
@@ -24,3 +26,62 @@ def test_block_planner_limits_buffer(tmp_path):
         total_bytes = sum(len(l.encode("utf-8")) for l in lines)
         assert total_bytes <= 512
         assert planned.end_line - planned.start_line + 1 <= 10
+
+
+def test_block_planner_skips_gaps_and_reads_exact_block_lines(tmp_path):
+    path = tmp_path / "numbered.csv"
+    path.write_text("".join(f"{idx}\n" for idx in range(1000)), encoding="utf-8")
+    planner = BlockPlanner(block_size=4, min_gap_lines=300)
+    plan = planner.plan(total_lines=1000)
+    for planned, lines in planner.iter_block_buffers(path, plan, encoding="utf-8", errors="strict"):
+        expected = [f"{idx}\n" for idx in range(planned.start_line, planned.end_line + 1)]
+        assert lines == expected
+
+
+def test_block_planner_yields_every_block_when_file_is_shorter_than_plan(tmp_path):
+    path = tmp_path / "short.csv"
+    path.write_text("".join(f"{idx}\n" for idx in range(30)), encoding="utf-8")
+    planner = BlockPlanner(block_size=5, min_gap_lines=10)
+    plan = planner.plan(total_lines=80)
+    buffers = list(planner.iter_block_buffers(path, plan, encoding="utf-8", errors="strict"))
+    assert [planned.block_id for planned, _ in buffers] == [block.block_id for block in plan]
+
+
+def test_update_type_flags_disproves_candidates():
+    numeric = ColumnStats(index=0)
+    for value in ("12", "3,5", "-1e3"):
+        update_type_flags(value, numeric)
+    assert numeric.maybe_numeric is True
+    assert numeric.maybe_bool is False
+
+    text = ColumnStats(index=1)
+    update_type_flags("nan", text)
+    assert text.maybe_numeric is False
+    assert text.maybe_date is False
+
+    dashed = ColumnStats(index=2)
+    update_type_flags("1-2", dashed)
+    assert dashed.maybe_numeric is False
+    assert dashed.maybe_date is True
+
+
+def test_adaptive_throttle_shrinks_after_sustained_slow_reports_and_regrows():
+    throttle = AdaptiveThrottle(max_workers=4, shrink_after=3)
+    for _ in range(2):
+        throttle.report(10.0)
+    assert throttle.limit == 4
+    throttle.report(10.0)
+    assert throttle.limit == 3
+
+    while throttle.average > throttle.fast_threshold:
+        throttle.report(0.1)
+    throttle.report(0.1)
+    assert throttle.limit == 4
+
+
+def test_build_signature_accepts_lines_with_and_without_line_endings():
+    for lines in (["a,b\n", "c,d\r\n", "e,f"], ["a,b", "c,d", "e,f"]):
+        signature = build_signature(lines, 10, encoding="utf-8")
+        assert signature.column_count == 2
+        assert signature.columns[0].sample_values == {"a", "c", "e"}
+        assert signature.columns[1].sample_values == {"b", "d", "f"}
@@ -1,4 +1,4 @@
-from core.analysis.column_profiler import profile_file_columns
+from core.analysis.column_profiler import HyperLogLogLite, profile_file_columns
 
 
 def test_profile_file_columns_basic(tmp_path):
@@ -28,3 +28,46 @@ def test_profile_file_columns_dates_and_nulls(tmp_path):
     assert date_profile.date_min == "2024-01-01"
     assert date_profile.date_max == "2024-02-02"
     assert date_profile.type_distribution["date"] == 2
+
+
+def test_hyperloglog_estimate_tracks_distinct_count():
+    counter = HyperLogLogLite()
+    for idx in range(5000):
+        counter.add(f"value-{idx % 2000}")
+
+    assert abs(counter.estimate() - 2000) < 2000 * 0.1
+
+
+def test_profile_file_columns_normalizes_supported_date_layouts(tmp_path):
+    path = tmp_path / "dates.csv"
+    path.write_text("d\n12/31/2023\n2023/06/01\n31-01-2024\n31.02.2024\n", encoding="utf-8")
+
+    profiles = profile_file_columns(path, delimiter=",", encoding="utf-8", errors="strict")
+
+    assert profiles[0].date_min == "2023-06-01"
+    assert profiles[0].date_max == "2024-01-31"
+
+
+def test_profile_file_columns_counts_repeated_values(tmp_path):
+    path = tmp_path / "status.csv"
+    path.write_text("code\n5\n5\n\n5\n7\n", encoding="utf-8")
+
+    profiles = profile_file_columns(path, delimiter=",", encoding="utf-8", errors="strict")
+
+    code_profile = profiles[0]
+    assert code_profile.type_distribution["integer"] == 4
+    assert code_profile.total_values == 4
+    assert code_profile.unique_estimate == 2
+    assert (code_profile.numeric_min, code_profile.numeric_max) == (5.0, 7.0)
+
+
+def test_profile_file_columns_switches_to_csv_parsing_at_first_quote(tmp_path):
+    path = tmp_path / "mixed.csv"
+    path.write_bytes(b'name,amount\r\nplain,1\r\n"Smith, J",2\r\n"multi\nline",3\r\n')
+
+    profiles = profile_file_columns(path, delimiter=",", encoding="utf-8", errors="strict")
+
+    assert len(profiles) == 2
+    assert profiles[0].total_values == 3
+    assert profiles[1].type_distribution["integer"] == 3
+    assert (profiles[1].numeric_min, profiles[1].numeric_max) == (1.0, 3.0)
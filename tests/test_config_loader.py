@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from common.config import error_mode_from_policy, load_runtime_config
+from common.config import error_mode_from_policy, load_config_document, load_runtime_config
 from common.errors import BackendError, ErrorCode
 
 
@@ -79,6 +79,73 @@ def test_blank_path_rejected(tmp_path: Path) -> None:
     assert exc.value.code == ErrorCode.CONFIG_ERROR
 
 
+def test_non_integer_field_reports_field_name(tmp_path: Path) -> None:
+    profile = {**_profile_payload(), "block_size": "many"}
+    config_path = _write_config(
+        tmp_path,
+        {
+            "version": 1,
+            "global": {"encoding": "utf-8", "error_policy": "replace"},
+            "profiles": {"low_memory": profile},
+        },
+    )
+    with pytest.raises(BackendError) as exc:
+        load_runtime_config("low_memory", config_path=config_path)
+    assert exc.value.message == f"profiles.low_memory.block_size must be an integer in {config_path}"
+
+
+def test_only_selected_profile_is_validated(tmp_path: Path) -> None:
+    config_path = _write_config(
+        tmp_path,
+        {
+            "version": 1,
+            "global": {
+                "encoding": "utf-8",
+                "error_policy": "replace",
+                "synonym_dictionary": "storage/synonyms.json",
+                "canonical_schema_path": "storage/canonical.json",
+            },
+            "profiles": {
+                "low_memory": _profile_payload(),
+                "broken": {"description": "missing numeric fields"},
+            },
+        },
+    )
+    config = load_runtime_config("low_memory", config_path=config_path)
+    assert config.profile.block_size == 1000
+
+    document = load_config_document(profile_name="low_memory", config_path=config_path)
+    assert set(document.profiles) == {"low_memory", "broken"}
+    assert "broken" in document.profiles
+    assert "missing" not in document.profiles
+    with pytest.raises(BackendError):
+        document.profiles["broken"]
+
+
+def test_config_document_cached_until_file_changes(tmp_path: Path) -> None:
+    payload = {
+        "version": 1,
+        "global": {"encoding": "utf-8", "error_policy": "replace"},
+        "profiles": {"low_memory": _profile_payload()},
+    }
+    config_path = _write_config(tmp_path, payload)
+    first = load_config_document(profile_name="low_memory", config_path=config_path)
+    assert load_config_document(profile_name="low_memory", config_path=config_path) is first
+
+    payload["profiles"]["low_memory"]["block_size"] = 12345
+    _write_config(tmp_path, payload)
+    reloaded = load_config_document(profile_name="low_memory", config_path=config_path)
+    assert reloaded.profiles["low_memory"].block_size == 12345
+
+
+def test_invalid_json_raises_config_error(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(BackendError) as exc:
+        load_runtime_config("low_memory", config_path=config_path)
+    assert exc.value.code == ErrorCode.CONFIG_ERROR
+
+
 def _write_config(tmp_path: Path, payload: dict) -> Path:
     path = tmp_path / "config.json"
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from dataclasses import replace
 from pathlib import Path
 from uuid import uuid4
 
@@ -36,8 +37,8 @@ def build_runtime(chunk_rows: int = 2) -> RuntimeConfig:
 
 
 def materialize_mapping(runtime: RuntimeConfig, csv_path: Path, tmp_path: Path) -> MappingConfig:
-    engine = AnalysisEngine(runtime)
-    results = engine.analyze_files([csv_path])
+    with AnalysisEngine(runtime) as engine:
+        results = engine.analyze_files([csv_path])
     blocks: list[FileBlock] = []
     for result in results:
         blocks.extend(result.blocks)
@@ -128,3 +129,26 @@ def test_pipeline_resume_and_progress_history(tmp_path: Path, monkeypatch: pytes
     assert replay, "History lookup returned no events for schema"
     assert replay[0].processed_rows <= replay[0].total_rows
     assert replay[0].file_path.name.endswith(".materialize")
+
+
+def test_analysis_engine_runs_repeatedly_and_closes_idempotently(tmp_path: Path) -> None:
+    base = build_runtime()
+    runtime = replace(base, profile=replace(base.profile, max_parallel_files=2))
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"part_{idx}.csv"
+        path.write_text(f"id,name\n{idx},row{idx}\n", encoding="utf-8")
+        paths.append(path)
+
+    engine = AnalysisEngine(runtime)
+    first = engine.analyze_files(paths)
+    second = engine.analyze_files(paths[::-1])
+    engine.close()
+    engine.close()
+    # A closed engine starts a fresh pool on demand.
+    third = engine.analyze_files(paths[:2])
+    engine.close()
+
+    assert [result.file_path for result in first] == [path.resolve() for path in paths]
+    assert [result.file_path for result in second] == [path.resolve() for path in paths[::-1]]
+    assert [result.file_path for result in third] == [path.resolve() for path in paths[:2]]
@@ -3,8 +3,16 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, Iterable, Sequence
 
+import pytest
+
 from common.models import ColumnStats, FileAnalysisResult, FileBlock, SchemaSignature
-from core.headers.cluster_builder import HeaderClusterizer
+from core.headers.cluster_builder import (
+    HeaderClusterizer,
+    HeaderNode,
+    VariantAccumulator,
+    _levenshtein_ratio,
+    _ngram_set,
+)
 
 
 def _build_stats(index: int, samples: Iterable[str], type_counts: Dict[str, int]) -> ColumnStats:
@@ -142,3 +150,51 @@ def test_clusterizer_handles_localized_city_synonyms(tmp_path) -> None:
     variant_names = {variant.raw_name.lower() for variant in city_cluster.variants}
     assert {"city", "місто", "town"}.issubset(variant_names)
     assert city_cluster.needs_review is False
+
+
+def test_clusterizer_only_compares_nodes_sharing_a_blocking_key() -> None:
+    def node(slug: str, skeleton: str) -> HeaderNode:
+        return HeaderNode(
+            key=slug,
+            display_name=slug,
+            slug=slug,
+            alias=slug,
+            translit=slug,
+            skeleton=skeleton,
+            type_profile={},
+            ngrams=_ngram_set(slug, 3),
+        )
+
+    nodes = [
+        node("amount", "mnt"),
+        node("amounts", "mnts"),
+        node("quantity", "qntt"),
+        node("brt", "brt"),
+        node("bort", "brt"),
+        node("am", "m"),
+    ]
+
+    pairs = HeaderClusterizer()._candidate_pairs(nodes)
+
+    assert (0, 1) in pairs  # shared n-grams
+    assert (3, 4) in pairs  # shared skeleton
+    assert (0, 5) in pairs  # short slug prefixing a longer one
+    assert (0, 2) not in pairs
+
+
+def test_rapidfuzz_similarity_matches_pure_python_ratio() -> None:
+    levenshtein = pytest.importorskip("rapidfuzz.distance").Levenshtein
+
+    for left, right in [("amount", "amounts"), ("city", "town"), ("", "x"), ("qty", "qty")]:
+        assert levenshtein.normalized_similarity(left, right) == pytest.approx(_levenshtein_ratio(left, right))
+
+
+def test_variant_accumulator_keeps_smallest_samples_under_cap() -> None:
+    accumulator = VariantAccumulator(Path("a.csv"), 0, "code", sample_cap=4)
+    for start in range(0, 40, 10):
+        stats = _build_stats(0, [f"v{value:02d}" for value in range(39 - start, 29 - start, -1)], {"text": 10})
+        accumulator.update(stats, 10)
+
+    assert len(accumulator.sample_values) <= 8
+    assert sorted(accumulator.sample_values)[:4] == ["v00", "v01", "v02", "v03"]
+    assert accumulator.row_count == 40
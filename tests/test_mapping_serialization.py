@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from common.mapping_serialization import (
+    deserialize_column_stats,
+    mapping_from_json_bytes,
+    mapping_to_json_bytes,
+    serialize_column_stats,
+)
 from common.models import (
     ColumnProfileResult,
     ColumnStats,
     FileBlock,
     HeaderCluster,
+    HeaderOccurrence,
     HeaderVariant,
     MappingConfig,
     SchemaColumn,
@@ -135,3 +142,32 @@ def test_legacy_mapping_payloads_upgrade_versions():
     upgraded = restored.to_dict()
     assert upgraded["artifact_version"] == MAPPING_ARTIFACT_VERSION
     assert upgraded["header_clusters"][0]["version"] == HEADER_CLUSTER_VERSION
+
+
+def test_mapping_json_bytes_round_trip():
+    data = mapping_to_json_bytes(_build_mapping(), include_samples=True, indent=True)
+    assert isinstance(data, bytes)
+    restored = mapping_from_json_bytes(data)
+    assert restored.blocks[0].signature.columns[0].sample_values == {"bar", "foo"}
+    assert restored.header_clusters[0].variants[0].normalized_name == "col0_norm"
+    assert restored.column_profiles[0].type_distribution == {"text": 2, "null": 0}
+
+
+def test_header_occurrences_serialize_as_rows_and_accept_legacy_objects():
+    mapping = _build_mapping()
+    mapping.header_occurrences = [HeaderOccurrence(raw_header="col0", file_id="input.csv", column_index=0)]
+    payload = mapping.to_dict()
+    assert payload["header_occurrences"] == [["col0", "input.csv", 0]]
+    assert MappingConfig.from_dict(payload).header_occurrences == mapping.header_occurrences
+
+    payload["header_occurrences"] = [{"raw_header": "col0", "file_id": "input.csv", "column_index": 0}]
+    assert MappingConfig.from_dict(payload).header_occurrences == mapping.header_occurrences
+
+
+def test_column_stats_type_counts_round_trip():
+    stats = ColumnStats(index=3, sample_count=5, maybe_numeric=False)
+    stats.type_counts = {"int": 3, "str": 2}
+    restored = deserialize_column_stats(serialize_column_stats(stats, False), index=3)
+    assert restored.type_counts == {"int": 3, "str": 2}
+    assert restored.maybe_numeric is False
+    assert restored.sample_count == 5
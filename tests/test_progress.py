@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from common.models import FileProgress
+from common.progress import ProgressLogger
+
+
+def test_progress_logger_appends_jsonl_and_reopens_after_close(tmp_path: Path) -> None:
+    log_path = tmp_path / "logs" / "progress.jsonl"
+    progress = FileProgress(
+        file_path=Path("input.csv"),
+        processed_rows=5,
+        total_rows=10,
+        current_phase="analysis",
+    )
+    with ProgressLogger(log_path) as logger:
+        logger.emit(progress)
+        logger.emit(progress)
+    logger.emit(progress)
+    logger.close()
+
+    events = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert len(events) == 3
+    assert events[0]["file_path"] == "input.csv"
+    assert events[0]["processed_rows"] == 5
+    assert events[0]["eta_seconds"] is None
+    assert "timestamp" in events[0]
+
+
+def test_progress_logger_batches_writes_until_flush_threshold(tmp_path: Path) -> None:
+    log_path = tmp_path / "progress.jsonl"
+    progress = FileProgress(file_path=Path("a.csv"), processed_rows=1, total_rows=1, current_phase="x")
+    logger = ProgressLogger(log_path, flush_every=3)
+    logger.emit(progress)
+    logger.emit(progress)
+    assert not log_path.exists()
+    logger.emit(progress)
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 3
+    logger.emit(progress)
+    logger.close()
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 4
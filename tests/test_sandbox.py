@@ -79,3 +79,12 @@ def test_child_inherits_allowlist(tmp_path: Path) -> None:
     assert child.root == root / "sub"
     assert inner == root / "sub" / "output.csv"
     assert external == allowed / "aux.log"
+
+
+def test_resolve_rejects_sibling_with_shared_prefix(tmp_path: Path) -> None:
+    root = (tmp_path / "job").resolve()
+    root.mkdir()
+    sandbox = Sandbox(root)
+
+    with pytest.raises(SandboxViolation):
+        sandbox.resolve("..", "job2", "file.csv")
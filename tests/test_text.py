@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from common.text import slugify
+
+
+def test_slugify_ascii_and_unicode_inputs():
+    assert slugify("  Customer ID ") == "customerid"
+    assert slugify("Order_Total-USD (2024)") == "ordertotalusd2024"
+    assert slugify("Straße Ünit") == "straenit"
+    assert slugify("") == ""